@@ -0,0 +1,29 @@
+# Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
+# Arista Networks, Inc. Confidential and Proprietary.
+
+'Vectorised geometry kernels for the GUI link layer.'
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def link_midpoints(x1, y1, x2, y2, ox, oy, out_x, out_y):
+        'Writes the offset midpoints of all link segments into out_x/out_y.'
+        for i in prange(x1.size):
+            out_x[i] = 0.5 * (x1[i] + x2[i]) + ox
+            out_y[i] = 0.5 * (y1[i] + y2[i]) + oy
+else:
+    # numba is optional; fall back to NumPy ufuncs with the same signature
+    def link_midpoints(x1, y1, x2, y2, ox, oy, out_x, out_y):
+        'Writes the offset midpoints of all link segments into out_x/out_y.'
+        np.add(x1, x2, out=out_x)
+        out_x *= 0.5
+        out_x += ox
+        np.add(y1, y2, out=out_y)
+        out_y *= 0.5
+        out_y += oy
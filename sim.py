@@ -92,6 +92,8 @@ class Topology:
       self.nodeBehavior = {}
       # track nodes with actions waiting
       self.waiting = set()
+      # links touched since the last step yield, as ( src, dst ) pairs
+      self.touched = set()
 
    def dump( self ):
       nodes = { k: n.dump() for k, n in self.nodes.items() }
@@ -149,11 +151,10 @@ class Topology:
          # make idempotent
          return
       del self.nodes[ name ]
-      # delete all related links
-      del self.links[ name ]
-      for linkList in self.links.values():
-         if name in linkList:
-            del linkList[ name ]
+      # drop incident links through the adjacency map, O(degree) rather
+      # than scanning every node's link list
+      for peer in self.links.pop( name, {} ):
+         self.links.get( peer, {} ).pop( name, None )
 
    def addLink( self, peerA, peerB, maxDepth=0 ):
       assert peerB not in self.links[ peerA ], 'duplicate link'
@@ -167,11 +168,17 @@ class Topology:
       assert dst in self.nodes, 'no such destination'
       self.nodes[ dst ].rxWaiting.add( src )
       self.waiting.add( dst )
+      self.touched.add( ( src, dst ) )
 
    def step( self ):
+      'yields a ( changedNodes, changedLinks ) delta per node processed'
       while self.waiting:
          n = self.waiting.pop()
+         self.touched = set()
          if self.nodes[ n ].runActivities():
             self.waiting.add( n )
-         yield
+         # the node may also have drained its incoming links
+         for peer in self.links.get( n, {} ):
+            self.touched.add( ( peer, n ) )
+         yield { n }, self.touched
 
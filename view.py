@@ -1,18 +1,25 @@
 # Copyright (c) 2025 Arista Networks, Inc.  All rights reserved.
 # Arista Networks, Inc. Confidential and Proprietary.
 
+import atexit
+import collections
 import sys
+import logging
 import math
 import os
 
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
-from PyQt5.QtGui import QBrush, QPainter, QPen, QColor, QPalette
+import numpy as np
+
+from contextlib import contextmanager
+
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThreadPool, QTimer
+from PyQt5.QtGui import QBrush, QPainter, QPen, QColor, QPalette, QTextCursor
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
     QGraphicsEllipseItem,
     QGraphicsLineItem,
-    QGraphicsTextItem,
+    QGraphicsSimpleTextItem,
     QGraphicsItem,
     QGraphicsScene,
     QGraphicsView,
@@ -22,14 +29,23 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
     QTextEdit,
+    QPlainTextEdit,
     QGroupBox,
     QLineEdit,
     QComboBox,
 )
 
+try:
+    from PyQt5.QtWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
+from _link_math import link_midpoints
 from sim import Topology, Node as SimNode, Link as SimLink
 from simFile import loadTopologyFile, dumpTopologyFile
 
+log = logging.getLogger(__name__)
+
 # --- Constants ---
 NODE_SIZE = 150
 LINK_THICKNESS_NORMAL = 5
@@ -50,6 +66,9 @@ TOOLTIP_WINDOW_Y = 200
 TOOLTIP_WINDOW_WIDTH = 400
 TOOLTIP_WINDOW_HEIGHT = 300
 ALIGNMENT_RADIUS = 200
+INFO_TEXT_OFFSET_X = 5
+INFO_TEXT_OFFSET_Y = -10 # Position slightly above the line's midpoint
+LOD_TEXT_SCALE = 0.4 # below this view scale, labels are unreadable anyway
 
 # Define some basic colors for the palette
 COLOR_BACKGROUND_DARK = QColor(43, 43, 43) # Similar to original QSS
@@ -57,12 +76,124 @@ COLOR_TEXT_LIGHT = QColor(240, 240, 240)
 COLOR_CONTROL_BACKGROUND = QColor(51, 51, 51) # For group boxes, etc.
 COLOR_BORDER_GREY = QColor(68, 68, 68)
 
+# Stylesheets are identical for every widget of a kind; build the strings
+# (and their rgb() component lookups) once at import instead of per widget.
+_BORDER_RGB = f"rgb({COLOR_BORDER_GREY.red()}, {COLOR_BORDER_GREY.green()}, {COLOR_BORDER_GREY.blue()})"
+_GRAPHICS_VIEW_QSS = f"border: 1px solid {_BORDER_RGB}; border-radius: 5px;"
+_GROUPBOX_QSS = f"""
+    QGroupBox {{
+        border: 1px solid {_BORDER_RGB};
+        border-radius: 5px;
+        margin-top: 10px; /* Space for title */
+    }}
+    QGroupBox::title {{
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+        color: rgb({COLOR_TEXT_LIGHT.red()}, {COLOR_TEXT_LIGHT.green()}, {COLOR_TEXT_LIGHT.blue()});
+        font-weight: bold;
+    }}
+"""
+
+# Shared pens: every UILink reuses these instead of constructing and
+# mutating a QPen per link / per click.
+PEN_NORMAL = QPen(LINK_COLOR_NORMAL, LINK_THICKNESS_NORMAL, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+PEN_HIGHLIGHT = QPen(LINK_COLOR_HIGHLIGHT, LINK_THICKNESS_HIGHLIGHT, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin)
+
+# One shared dark palette for every text input / log widget, instead of
+# copy-constructing and mutating a QPalette per widget.
+DARK_TEXT_PALETTE = QPalette()
+DARK_TEXT_PALETTE.setColor(QPalette.Base, QColor(58, 58, 58))
+DARK_TEXT_PALETTE.setColor(QPalette.Text, COLOR_TEXT_LIGHT)
+
+# Circle layouts keyed by node count: the radius and scene center never
+# change, so repeated aligns at the same count reuse the coordinates.
+_LAYOUT_CACHE: dict[int, tuple[list, list]] = {}
+
+# below this count NumPy's fixed call overhead loses to a plain loop
+SMALL_LAYOUT_N = 32
+
+def _circle_layout(num_nodes: int) -> tuple[list, list]:
+    """Returns cached (xs, ys) circle coordinates for the given node count."""
+    cached = _LAYOUT_CACHE.get(num_nodes)
+    if cached is None:
+        mid_x, mid_y = SCENE_WIDTH / 2, SCENE_HEIGHT / 2
+        if num_nodes < SMALL_LAYOUT_N:
+            # pure-Python path with hoisted locals for small scenes
+            sin, cos, r = math.sin, math.cos, ALIGNMENT_RADIUS
+            step = 2 * math.pi / num_nodes
+            xs = [r * sin(i * step) + mid_x for i in range(num_nodes)]
+            ys = [r * cos(i * step) + mid_y for i in range(num_nodes)]
+        else:
+            theta = np.arange(num_nodes, dtype=np.float32) * (2 * math.pi / num_nodes)
+            xs = (ALIGNMENT_RADIUS * np.sin(theta) + mid_x).tolist()
+            ys = (ALIGNMENT_RADIUS * np.cos(theta) + mid_y).tolist()
+        cached = _LAYOUT_CACHE[num_nodes] = (xs, ys)
+    return cached
+
+# Above this many nodes the layout trig is computed on a worker thread so
+# the GUI stays responsive; the setPos application always runs on the GUI
+# thread once the coordinates are cached.
+ASYNC_LAYOUT_THRESHOLD = 512
+
+class _LayoutTask(QRunnable):
+    """Warms the circle-layout cache for a node count off the GUI thread."""
+    __slots__ = ('num_nodes', 'signals')
+
+    class Signals(QObject):
+        finished = pyqtSignal(int)
+
+    def __init__(self, num_nodes: int):
+        super().__init__()
+        self.num_nodes = num_nodes
+        self.signals = self.Signals()
+
+    def run(self):
+        _circle_layout(self.num_nodes)
+        self.signals.finished.emit(self.num_nodes)
+
+class QtOutputStream(QObject):
+    """
+    A file-like stream that forwards simulation print() output to the GUI log.
+
+    Writes are buffered and emitted as one coalesced signal per timer
+    window, so chatty simulations pay for one log append per flush
+    instead of one QTextEdit reflow per write.
+    """
+    text_written = pyqtSignal(str)
+
+    FLUSH_INTERVAL_MS = 16
+
+    def __init__(self):
+        super().__init__()
+        self._buffer: list[str] = []
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._timer.timeout.connect(self.flush)
+
+    def write(self, text: str):
+        """Buffers a write and (re)arms the coalescing timer."""
+        if not text:
+            return
+        self._buffer.append(text)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Emits everything buffered so far as a single chunk."""
+        if self._buffer:
+            text = "".join(self._buffer)
+            self._buffer.clear()
+            self.text_written.emit(text)
+
 class ToolTipWindow(QMainWindow):
     """
     A pop-up window to display and interact with the state of a simulation item (node or link).
     Allows viewing the item's state and triggering its removal from the simulation.
     """
     delete_item_from_scene = pyqtSignal(object)
+    window_closed = pyqtSignal(object)
 
     def __init__(self, parent_item: QGraphicsItem, item_name: str, item_state: dict = None):
         """
@@ -77,6 +208,7 @@ class ToolTipWindow(QMainWindow):
         self._parent_item = parent_item
         self._item_name = item_name
         self._item_state = item_state if item_state is not None else {}
+        self._last_text = None
         self.setWindowFlags(self.windowFlags() | Qt.WindowStaysOnTopHint)
 
         self._setup_ui()
@@ -94,7 +226,8 @@ class ToolTipWindow(QMainWindow):
         self.name_label = QLabel(f"Item: {self._item_name}")
         layout.addWidget(self.name_label)
 
-        self.state_display = QTextEdit()
+        # Plain text avoids QTextEdit's rich-text layout on every refresh.
+        self.state_display = QPlainTextEdit()
         self.state_display.setReadOnly(True)
         layout.addWidget(self.state_display)
 
@@ -119,7 +252,11 @@ class ToolTipWindow(QMainWindow):
                     state_text_parts.append(f"  {sub_key}: {sub_value_display}")
             else:
                 state_text_parts.append(f"{key}: {value}")
-        self.state_display.setText("\n".join(state_text_parts))
+        new_text = "\n".join(state_text_parts)
+        if new_text == self._last_text:
+            return # unchanged since the last render, skip the re-layout
+        self.state_display.setPlainText(new_text)
+        self._last_text = new_text
 
     def update_item_state_display(self, new_state: dict):
         """
@@ -137,11 +274,24 @@ class ToolTipWindow(QMainWindow):
             self.delete_item_from_scene.emit(self._parent_item)
             self.close()
 
+    def closeEvent(self, event):
+        """Notifies listeners that this window is no longer visible."""
+        self.window_closed.emit(self._parent_item)
+        super().closeEvent(event)
+
 class UILink(QGraphicsLineItem):
     """
     Represents a link in the UI, connecting two UINode objects.
     Visualized as a line, with click interactions to view details.
     """
+    # Declared attributes live in slots; large graphs allocate one of these
+    # per link, so the compact layout matters.
+    __slots__ = (
+        'name', '_parent_window', 'start_node', 'end_node',
+        '_sim_link_ref1', '_sim_link_ref2', '_detail_window',
+        '_last_start_pos', '_last_end_pos', 'info_text_item',
+    )
+
     def __init__(self, parent_window: 'MainWindow', name: str, start_node: 'UINode', end_node: 'UINode'):
         """
         Initializes a UILink.
@@ -160,24 +310,30 @@ class UILink(QGraphicsLineItem):
         self._sim_link_ref1: SimLink = None
         self._sim_link_ref2: SimLink = None
         self._detail_window: ToolTipWindow = None
+        # Last known endpoint positions, used to skip redundant setLine calls.
+        self._last_start_pos = None
+        self._last_end_pos = None
 
-        self.info_text_item = QGraphicsTextItem(self)
+        # Simple text items carry no QTextDocument, far lighter per label
+        self.info_text_item = QGraphicsSimpleTextItem("", self)
         info_font = self.info_text_item.font()
         info_font.setPointSize(max(6, info_font.pointSize() - 3))
         self.info_text_item.setFont(info_font)
-        self.info_text_item.setDefaultTextColor(NODE_OUTLINE_COLOR)
+        self.info_text_item.setBrush(QBrush(NODE_OUTLINE_COLOR))
+        # labels should never swallow clicks or join hit-testing
+        self.info_text_item.setAcceptedMouseButtons(Qt.NoButton)
 
         self._setup_appearance()
 
         # Register this link with its connected nodes
-        self.start_node.connected_lines.append(self)
-        self.end_node.connected_lines.append(self)
+        self.start_node.connected_lines.add(self)
+        self.end_node.connected_lines.add(self)
         
         self.update_position() # Set initial position
 
     def _setup_appearance(self):
         """Configures the visual appearance of the link."""
-        self.setPen(QPen(LINK_COLOR_NORMAL, LINK_THICKNESS_NORMAL, Qt.SolidLine, Qt.RoundCap, Qt.RoundJoin))
+        self.setPen(PEN_NORMAL)
         self.setZValue(-1) # Draw links behind nodes
 
     def set_sim_link_ref2(self, link_ref: SimLink ):
@@ -193,39 +349,21 @@ class UILink(QGraphicsLineItem):
         """
         self._sim_link_ref1 = link_ref
 
+    @staticmethod
+    def _direction_info(sim_link: SimLink, src_name: str, dst_name: str) -> str:
+        """Formats one direction's queue summary without materialising the queue via dump()."""
+        max_str = str(sim_link.maxDepth) if sim_link.maxDepth > 0 else "inf"
+        return f"{src_name} -> {dst_name}: Q {sim_link.depth()}/{max_str}"
+
     def update_info_text(self):
-        info_str = ""
-        if self._sim_link_ref1 and self._sim_link_ref2:
-            dump1 = self._sim_link_ref1.dump()
-            dump2 = self._sim_link_ref2.dump()
-
-            q1_depth = len(dump1['queue'])
-            max1_info = f"max: {dump1['maxDepth']}" if dump1['maxDepth'] > 0 else "max: inf"
-            
-            q2_depth = len(dump2['queue'])
-            max2_info = f"max: {dump2['maxDepth']}" if dump2['maxDepth'] > 0 else "max: inf"
-            info1_str = f"{self.start_node.name} -> {self.end_node.name}: Q {q1_depth}/{max1_info.split(': ')[1]}"
-            info2_str = f"{self.end_node.name} -> {self.start_node.name}: Q {q2_depth}/{max2_info.split(': ')[1]}"
-            info_str = f"{info1_str}\n{info2_str}"
-            
-            self.info_text_item.setPlainText(info_str)
-            self._position_info_text()
-        elif self._sim_link_ref1:
-            dump1 = self._sim_link_ref1.dump()
-            q1_depth = len(dump1['queue'])
-            max1_info = f"max: {dump1['maxDepth']}" if dump1['maxDepth'] > 0 else "max: inf"
-            info_str = f"{self.start_node.name} -> {self.end_node.name}: Q {q1_depth}/{max1_info.split(': ')[1]}"
-            self.info_text_item.setPlainText(info_str)
-            self._position_info_text()
-        elif self._sim_link_ref2:
-            dump2 = self._sim_link_ref2.dump()
-            q2_depth = len(dump2['queue'])
-            max2_info = f"max: {dump2['maxDepth']}" if dump2['maxDepth'] > 0 else "max: inf"
-            info_str = f"{self.end_node.name} -> {self.start_node.name}: Q {q2_depth}/{max2_info.split(': ')[1]}"
-            self.info_text_item.setPlainText(info_str)
+        parts = []
+        if self._sim_link_ref1:
+            parts.append(self._direction_info(self._sim_link_ref1, self.start_node.name, self.end_node.name))
+        if self._sim_link_ref2:
+            parts.append(self._direction_info(self._sim_link_ref2, self.end_node.name, self.start_node.name))
+        self.info_text_item.setText("\n".join(parts))
+        if parts:
             self._position_info_text()
-        else:
-            self.info_text_item.setPlainText("")
 
         if self._detail_window and self._detail_window.isVisible():
             self._update_tooltip()
@@ -235,25 +373,30 @@ class UILink(QGraphicsLineItem):
             return
         mid_x = (self.line().p1().x() + self.line().p2().x()) / 2
         mid_y = (self.line().p1().y() + self.line().p2().y()) / 2
-        offset_x = 5
-        offset_y = -10 # Position slightly above the line's midpoint
+        self.position_info_text_at(mid_x + INFO_TEXT_OFFSET_X, mid_y + INFO_TEXT_OFFSET_Y)
+
+    def position_info_text_at(self, mid_x: float, mid_y: float):
+        """Places the info text around a precomputed, already-offset midpoint."""
         text_rect = self.info_text_item.boundingRect()
-        self.info_text_item.setPos(mid_x - text_rect.width() / 2 + offset_x, mid_y - text_rect.height() / 2 + offset_y)
+        self.info_text_item.setPos(mid_x - text_rect.width() / 2, mid_y - text_rect.height() / 2)
 
     def update_position(self):
         """Updates the line's start and end points based on the connected nodes' positions."""
         if self.start_node and self.end_node:
+            start_pos = self.start_node.scenePos()
+            end_pos = self.end_node.scenePos()
+            if start_pos == self._last_start_pos and end_pos == self._last_end_pos:
+                return # neither endpoint moved, nothing to redraw
+            self._last_start_pos = start_pos
+            self._last_end_pos = end_pos
             p1 = self.start_node.center_point()
             p2 = self.end_node.center_point()
             self.setLine(p1.x(), p1.y(), p2.x(), p2.y())
-            self._position_info_text() 
+            self._position_info_text()
 
     def mousePressEvent(self, event):
-        print(f"Link chosen: {self.name} (between {self.start_node.name} and {self.end_node.name})")
-        current_pen = self.pen()
-        current_pen.setColor(LINK_COLOR_HIGHLIGHT)
-        current_pen.setWidth(LINK_THICKNESS_HIGHLIGHT)
-        self.setPen(current_pen)
+        log.debug("Link chosen: %s (between %s and %s)", self.name, self.start_node.name, self.end_node.name)
+        self.setPen(PEN_HIGHLIGHT)
         self.update()
 
         if self._sim_link_ref1 and self._sim_link_ref2:
@@ -265,10 +408,15 @@ class UILink(QGraphicsLineItem):
             self._detail_window.delete_item_from_scene.connect(self._parent_window.remove_ui_link)
             self._detail_window.show()
         else:
-            print(f"Warning: UILink {self.name} has no associated SimLink(s).")
+            log.warning("UILink %s has no associated SimLink(s).", self.name)
 
         super().mousePressEvent(event)
-    
+
+    def mouseReleaseEvent(self, event):
+        self.setPen(PEN_NORMAL)
+        self.update()
+        super().mouseReleaseEvent(event)
+
     def _update_tooltip(self):
         if self._sim_link_ref1 and self._sim_link_ref2:
             combined_link_state = {
@@ -283,6 +431,14 @@ class UINode(QGraphicsEllipseItem):
     It visualizes the node as an ellipse and holds a reference to its corresponding simulation node.
     Clicking the node opens a detail window.
     """
+    # Declared attributes live in slots; large graphs allocate one of these
+    # per node, so the compact layout matters.
+    __slots__ = (
+        'name', '_parent_window', '_sim_node_ref', '_detail_window',
+        '_last_state_text', 'connected_lines', 'name_text_item',
+        'state_text_item', '_name_rect',
+    )
+
     def __init__(self, parent_window: 'MainWindow', sim_node_name: str = "default0", x: float = 0, y: float = 0):
         """
         Initializes a UINode.
@@ -300,7 +456,8 @@ class UINode(QGraphicsEllipseItem):
         self._parent_window = parent_window
         self._sim_node_ref: SimNode = None
         self._detail_window: ToolTipWindow = None
-        self.connected_lines: list[UILink] = [] # Store references to connected UILinks
+        self._last_state_text = None
+        self.connected_lines: set[UILink] = set() # Connected UILinks; hashed for O(1) removal
 
         self._setup_appearance(x, y)
 
@@ -312,17 +469,25 @@ class UINode(QGraphicsEllipseItem):
         self.setPen(pen)
         self.setPos(x, y)
         self.setFlag(QGraphicsItem.ItemIsSelectable) # Allows selection, but not dragging currently
+        # Notify connected links directly when this node moves, so only
+        # affected links update instead of polling every link in the scene.
+        self.setFlag(QGraphicsItem.ItemSendsScenePositionChanges)
         
-        self.name_text_item = QGraphicsTextItem(self.name, self)
+        # Simple text items carry no QTextDocument, far lighter per label
+        self.name_text_item = QGraphicsSimpleTextItem(self.name, self)
         font = self.name_text_item.font()
         font.setBold(True)
         self.name_text_item.setFont(font)
+        # labels should never swallow clicks or join hit-testing
+        self.name_text_item.setAcceptedMouseButtons(Qt.NoButton)
+        # the name never changes after construction, so its metrics don't either
+        self._name_rect = self.name_text_item.boundingRect()
 
-        self.state_text_item = QGraphicsTextItem("", self)
+        self.state_text_item = QGraphicsSimpleTextItem("", self)
         state_font = self.state_text_item.font()
         state_font.setPointSize(max(6, state_font.pointSize() - 2))
         self.state_text_item.setFont(state_font)
-        self.state_text_item.setTextWidth(NODE_SIZE * 0.8)
+        self.state_text_item.setAcceptedMouseButtons(Qt.NoButton)
         self._center_text()
 
     def set_sim_node_ref(self, sim_ref: SimNode):
@@ -332,6 +497,13 @@ class UINode(QGraphicsEllipseItem):
         self._sim_node_ref = sim_ref
         self.update_ui_from_sim_state()
 
+    def itemChange(self, change, value):
+        """Propagates position changes to connected links."""
+        if change == QGraphicsItem.ItemScenePositionHasChanged:
+            for link in self.connected_lines:
+                link.update_position()
+        return super().itemChange(change, value)
+
     def center_point(self):
         """
         Calculates and returns the global scene coordinates of the node's center.
@@ -339,43 +511,66 @@ class UINode(QGraphicsEllipseItem):
         return self.scenePos() + self.boundingRect().center()
 
     def update_ui_from_sim_state(self):
-        """Updates the UI node's visual representation and detail window based on its sim node's state."""
+        """Updates the UI node's visual representation based on its sim node's state."""
         if self._sim_node_ref:
             node_dump = self._sim_node_ref.dump()
             state = node_dump[ "state" ]
             state_display_text = ", ".join(f"{k_short}:{v}" for k_short, v in list(state.items())[:2])
-            self.state_text_item.setPlainText(state_display_text)
+            if state_display_text == self._last_state_text:
+                return # no visible change, skip the text re-layout
+            self._last_state_text = state_display_text
+            self.state_text_item.setText(state_display_text)
+            # the text bounding rect only changes when the text does
             self._center_text()
 
-            if self._detail_window and self._detail_window.isVisible():
-                self._detail_window.update_item_state_display(state)
+    def set_lod(self, scale: float):
+        """Hides the text labels when the view is zoomed out past readability."""
+        show_text = scale >= LOD_TEXT_SCALE
+        if show_text != self.name_text_item.isVisible():
+            self.name_text_item.setVisible(show_text)
+            self.state_text_item.setVisible(show_text)
+
+    def update_detail_window(self):
+        """Refreshes the detail window contents; only called while it is open."""
+        if self._sim_node_ref and self._detail_window:
+            self._detail_window.update_item_state_display(self._sim_node_ref.state)
+
+    # The ellipse never changes for a fixed NODE_SIZE, so its center and the
+    # name label's vertical anchor are class constants rather than three
+    # boundingRect() calls per update.
+    _ELLIPSE_CENTER_X = 0.0
+    _NAME_CENTER_Y = -NODE_SIZE / 2 + NODE_SIZE * 0.15
 
     def _center_text(self):
-        """Centers the text item within the ellipse."""
-        ellipse_rect = self.boundingRect()
-        center_x = ellipse_rect.center().x()
-        
-        name_rect = self.name_text_item.boundingRect()
-        name_x = center_x - name_rect.width() / 2
-        name_y = ellipse_rect.top() + (ellipse_rect.height() * 0.15) - name_rect.height() / 2
+        """Centers the text items within the ellipse using cached metrics."""
+        name_rect = self._name_rect
+        name_x = self._ELLIPSE_CENTER_X - name_rect.width() / 2
+        name_y = self._NAME_CENTER_Y - name_rect.height() / 2
         self.name_text_item.setPos(name_x, name_y)
 
         state_rect = self.state_text_item.boundingRect()
-        state_x = center_x - state_rect.width() / 2
-        state_y = self.name_text_item.y() + name_rect.height() + 2 
+        state_x = self._ELLIPSE_CENTER_X - state_rect.width() / 2
+        state_y = name_y + name_rect.height() + 2
         self.state_text_item.setPos(state_x, state_y)
 
     def mousePressEvent(self, event):
         """Handles mouse press events on the node."""
         if event.button() == Qt.LeftButton:
             if self._sim_node_ref:
-                # Pass self as the parent item to the ToolTipWindow for deletion signal
-                self._detail_window = ToolTipWindow(self, self.name, self._sim_node_ref.state)
-                # Connect the signal from the ToolTipWindow to the MainWindow's removal method
-                self._detail_window.delete_item_from_scene.connect(self._parent_window.remove_ui_node)
+                if self._detail_window is None:
+                    # Lazily build one detail window per node and reuse it on
+                    # later clicks instead of allocating a fresh QMainWindow.
+                    self._detail_window = ToolTipWindow(self, self.name, self._sim_node_ref.state)
+                    # Connect the signal from the ToolTipWindow to the MainWindow's removal method
+                    self._detail_window.delete_item_from_scene.connect(self._parent_window.remove_ui_node)
+                    self._detail_window.window_closed.connect(self._parent_window.note_detail_closed)
+                else:
+                    self._detail_window.update_item_state_display(self._sim_node_ref.state)
                 self._detail_window.show()
+                self._detail_window.raise_()
+                self._parent_window.note_detail_opened(self)
             else:
-                print(f"Warning: UINode {self.name} has no associated SimNode.")
+                log.warning("UINode %s has no associated SimNode.", self.name)
         super().mousePressEvent(event)
 
 class MainWindow(QWidget):
@@ -395,8 +590,41 @@ class MainWindow(QWidget):
         self._controller = controller_ref # Reference to the main controller
 
         self.scene = QGraphicsScene(0, 0, SCENE_WIDTH, SCENE_HEIGHT)
+        # A fixed sceneRect keeps the BSP tree stable as items come and go;
+        # without it the index is rebuilt whenever the bounds grow.
+        self.scene.setSceneRect(0, 0, SCENE_WIDTH, SCENE_HEIGHT)
+        # BSP indexing keeps hit-testing O(log N); the tree depth is retuned
+        # to the node count whenever the geometry arrays are rebuilt.
+        self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
         self.ui_nodes: dict[str, UINode] = {}
         self.ui_links: dict[str, UILink] = {}
+        # Canonical endpoint-pair index: both directions of a duplex link
+        # map to the same entry with a single hash, so no reversed-name
+        # string needs building on every add. ui_links keeps the display names.
+        self._link_by_pair: dict[frozenset, UILink] = {}
+        # Nodes whose detail windows are currently open; only these need
+        # their windows refreshed on each simulation step.
+        self._open_detail_nodes: set = set()
+
+        # Structure-of-arrays mirror of the link geometry: node centers in
+        # one (N,2) array and per-link endpoint indices in an (M,2) array,
+        # so endpoint updates become one vectorised gather instead of
+        # per-link QPointF attribute chasing. Rebuilt on layout changes.
+        self._node_xy: np.ndarray = None
+        self._link_node_idx: np.ndarray = None
+        self._link_list: list[UILink] = []
+        self._geometry_dirty = False
+        # endpoints as last pushed to Qt, ordered like _link_list; used to
+        # mask out links whose geometry did not actually move
+        self._prev_endpoints: np.ndarray = None
+        # When set, add/remove paths skip the per-item radial re-layout so
+        # bulk operations can realign the scene once at the end.
+        self._suspend_layout = False
+        # (directory mtime, sorted yaml names) from the last examples scan
+        self._examples_cache = None
+        # log lines awaiting a coalesced flush on the next event-loop turn
+        self._log_buffer: list[str] = []
+        self._log_pending = False
 
         self._setup_ui()
 
@@ -416,10 +644,9 @@ class MainWindow(QWidget):
         self.output_log = QTextEdit()
         self.output_log.setReadOnly(True)
         self.output_log.setObjectName("outputLog")
-        text_edit_palette = self.output_log.palette()
-        text_edit_palette.setColor(QPalette.Base, QColor(58, 58, 58))
-        text_edit_palette.setColor(QPalette.Text, COLOR_TEXT_LIGHT)
-        self.output_log.setPalette(text_edit_palette)
+        self.output_log.setPalette(DARK_TEXT_PALETTE)
+        # bound log memory; old blocks fall off the top
+        self.output_log.document().setMaximumBlockCount(5000)
 
         control_panel_layout = QVBoxLayout()
 
@@ -429,14 +656,22 @@ class MainWindow(QWidget):
         control_panel_layout.addWidget(self._create_log_group(), 5)
 
         graphics_view = QGraphicsView(self.scene)
+        self.view = graphics_view
         graphics_view.setRenderHint(QPainter.Antialiasing)
         graphics_view.setMouseTracking(True)
         graphics_view.setRenderHint(QPainter.SmoothPixmapTransform)
-        graphics_view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        if QOpenGLWidget is not None:
+            # Composite the scene on the GPU; OpenGL viewports require
+            # full-viewport updates, which the GPU absorbs cheaply.
+            graphics_view.setViewport(QOpenGLWidget())
+            graphics_view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        else:
+            # Software raster: repaint only the regions items mark dirty.
+            graphics_view.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
         graphics_view_palette = graphics_view.palette()
         graphics_view_palette.setColor(QPalette.Base, QColor(60, 60, 60))
         graphics_view.setPalette(graphics_view_palette)
-        graphics_view.setStyleSheet(f"border: 1px solid rgb({COLOR_BORDER_GREY.red()}, {COLOR_BORDER_GREY.green()}, {COLOR_BORDER_GREY.blue()}); border-radius: 5px;")
+        graphics_view.setStyleSheet(_GRAPHICS_VIEW_QSS)
 
 
         main_layout = QHBoxLayout(self)
@@ -453,22 +688,8 @@ class MainWindow(QWidget):
         group_box_palette.setColor(QPalette.WindowText, COLOR_TEXT_LIGHT)
         group_box.setPalette(group_box_palette)
         
-        # Set border for QGroupBox using AI power
-        group_box.setStyleSheet(f"""
-            QGroupBox {{
-                border: 1px solid rgb({COLOR_BORDER_GREY.red()}, {COLOR_BORDER_GREY.green()}, {COLOR_BORDER_GREY.blue()});
-                border-radius: 5px;
-                margin-top: 10px; /* Space for title */
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                color: rgb({COLOR_TEXT_LIGHT.red()}, {COLOR_TEXT_LIGHT.green()}, {COLOR_TEXT_LIGHT.blue()});
-                font-weight: bold;
-            }}
-        """)
-        
+        group_box.setStyleSheet(_GROUPBOX_QSS)
+
         layout = QVBoxLayout(group_box)
         layout.setContentsMargins(10, 20, 10, 10)
         layout.setSpacing(5)
@@ -482,10 +703,7 @@ class MainWindow(QWidget):
         layout.addWidget(label_node_name)
         self.node_input = QLineEdit()
         self.node_input.setPlaceholderText("e.g., node1")
-        line_edit_palette = self.node_input.palette()
-        line_edit_palette.setColor(QPalette.Base, QColor(58, 58, 58))
-        line_edit_palette.setColor(QPalette.Text, COLOR_TEXT_LIGHT)
-        self.node_input.setPalette(line_edit_palette)
+        self.node_input.setPalette(DARK_TEXT_PALETTE)
         layout.addWidget(self.node_input)
 
         add_node_button = QPushButton("Add New Node")
@@ -501,17 +719,14 @@ class MainWindow(QWidget):
         layout.addWidget(label_peer1)
         self.peer1_input = QLineEdit()
         self.peer1_input.setPlaceholderText("e.g., n1")
-        line_edit_palette = self.peer1_input.palette()
-        line_edit_palette.setColor(QPalette.Base, QColor(58, 58, 58))
-        line_edit_palette.setColor(QPalette.Text, COLOR_TEXT_LIGHT)
-        self.peer1_input.setPalette(line_edit_palette)
+        self.peer1_input.setPalette(DARK_TEXT_PALETTE)
         layout.addWidget(self.peer1_input)
 
         label_peer2 = QLabel("Node 2 Name:")
         layout.addWidget(label_peer2)
         self.peer2_input = QLineEdit()
         self.peer2_input.setPlaceholderText("e.g., n2")
-        self.peer2_input.setPalette(line_edit_palette)
+        self.peer2_input.setPalette(DARK_TEXT_PALETTE)
         layout.addWidget(self.peer2_input)
 
         add_link_button = QPushButton("Add New Link")
@@ -533,10 +748,7 @@ class MainWindow(QWidget):
 
         self.dump_filename_input = QLineEdit()
         self.dump_filename_input.setPlaceholderText("Enter filename (e.g., my_topo.yaml)")
-        line_edit_palette = self.dump_filename_input.palette() # Get default
-        line_edit_palette.setColor(QPalette.Base, QColor(58, 58, 58)) # Set custom base
-        line_edit_palette.setColor(QPalette.Text, COLOR_TEXT_LIGHT)   # Set custom text
-        self.dump_filename_input.setPalette(line_edit_palette)
+        self.dump_filename_input.setPalette(DARK_TEXT_PALETTE)
         layout.addWidget(self.dump_filename_input)
 
         dump_topology_button = QPushButton("Dump to File")
@@ -562,12 +774,8 @@ class MainWindow(QWidget):
             self._controller.log_message("Please enter a filename for the topology dump.")
             return
 
-        if not (file_name_only.endswith(".yaml") or file_name_only.endswith(".yml")):
-            if "." in file_name_only:
-                base, ext = os.path.splitext(file_name_only)
-                file_name_only += ".yaml"
-            else:
-                file_name_only += ".yaml"
+        if not file_name_only.endswith((".yaml", ".yml")):
+            file_name_only += ".yaml"
         try:
             base_save_dir = os.path.dirname(os.path.abspath(sys.argv[0])) 
         except:
@@ -589,16 +797,24 @@ class MainWindow(QWidget):
             self.topology_combo_box.setEnabled(False)
             return
         try:
-            yaml_files = [
-                f for f in os.listdir(examples_dir)
-                if os.path.isfile(os.path.join(examples_dir, f)) and (f.endswith(".yaml") or f.endswith(".yml"))
-            ]
+            # scandir caches is_file in the DirEntry, one stat per entry;
+            # skip the rescan entirely while the directory mtime is unchanged.
+            dir_mtime = os.stat(examples_dir).st_mtime
+            if self._examples_cache and self._examples_cache[0] == dir_mtime:
+                yaml_files = self._examples_cache[1]
+            else:
+                with os.scandir(examples_dir) as entries:
+                    yaml_files = sorted(
+                        entry.name for entry in entries
+                        if entry.is_file() and entry.name.endswith((".yaml", ".yml"))
+                    )
+                self._examples_cache = (dir_mtime, yaml_files)
             if not yaml_files:
                 self.topology_combo_box.addItem("No YAML files found.", userData=None)
                 self.topology_combo_box.setEnabled(False)
             else:
                 self.topology_combo_box.setEnabled(True)
-                for file_name in sorted(yaml_files):
+                for file_name in yaml_files:
                     full_path = os.path.join(examples_dir, file_name)
                     self.topology_combo_box.addItem(file_name, userData=full_path)
         except Exception as e:
@@ -622,10 +838,16 @@ class MainWindow(QWidget):
     
     def restart_ui(self):
         """Clears all UI nodes and links and resets the output log."""
-        for ui_node_item in list(self.ui_nodes.values()):
-            self.remove_ui_node(ui_node_item)
+        self._suspend_layout = True
+        try:
+            for ui_node_item in list(self.ui_nodes.values()):
+                self.remove_ui_node(ui_node_item)
+        finally:
+            self._suspend_layout = False
         self.ui_nodes.clear() # Ensure the dictionary is empty
         self.ui_links.clear()
+        self._link_by_pair.clear()
+        self._align_ui_elements()
         self.output_log.clear()
 
     def _on_add_sim_node_clicked(self):
@@ -642,17 +864,71 @@ class MainWindow(QWidget):
             sim_node_obj: The corresponding SimNode object.
         """
         new_ui_node = UINode(self, sim_node_name)
+        # Node visuals change rarely; cache the rendered pixmap so pan/zoom
+        # blits it instead of re-rendering the ellipse and text. Qt
+        # invalidates the cache automatically when the item updates.
+        new_ui_node.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         new_ui_node.set_sim_node_ref(sim_node_obj)
 
         self.ui_nodes[sim_node_name] = new_ui_node
         self.scene.addItem(new_ui_node)
+        if not self._suspend_layout:
+            self._align_ui_elements()
+
+    @contextmanager
+    def batch_update(self):
+        """Suspends scene indexing and view repaints around a bulk UI refresh.
+
+        All item mutations inside the block are composited into a single
+        viewport update at the end instead of one repaint per item.
+        """
+        saved_index_method = self.scene.itemIndexMethod()
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.scene.setItemIndexMethod(saved_index_method)
+            self.view.setUpdatesEnabled(True)
+            self.view.viewport().update()
+
+    def begin_bulk_load(self):
+        """Suspends repaints, scene signals and per-item layout during a bulk populate."""
+        self.scene.blockSignals(True)
+        self.setUpdatesEnabled(False)
+        self._suspend_layout = True
+
+    def end_bulk_load(self):
+        """Re-enables updates after a bulk populate and repaints once."""
+        self._suspend_layout = False
+        self.scene.blockSignals(False)
+        self.setUpdatesEnabled(True)
         self._align_ui_elements()
+        self.scene.update()
+
+    def note_detail_opened(self, ui_node: UINode):
+        """Registers a node as having an open detail window."""
+        self._open_detail_nodes.add(ui_node)
+
+    def note_detail_closed(self, ui_node: UINode):
+        """Unregisters a node whose detail window was closed."""
+        self._open_detail_nodes.discard(ui_node)
+
+    def _visible_scene_rect(self):
+        """Returns the scene-space rectangle currently shown by the view."""
+        return self.view.mapToScene(self.view.viewport().rect()).boundingRect()
 
     def update_ui_nodes(self):
-        """Updates the visual state of all UI nodes based on their simulation state."""
+        """Updates the visual state of on-screen UI nodes based on their simulation state."""
+        visible = self._visible_scene_rect()
+        scale = self.view.transform().m11()
         for ui_node in self.ui_nodes.values():
-            ui_node.update_ui_from_sim_state()
-        self.scene.update()
+            ui_node.set_lod(scale)
+            if ui_node.sceneBoundingRect().intersects(visible):
+                ui_node.update_ui_from_sim_state()
+        # detail windows are separate top-level windows, never culled
+        for ui_node in self._open_detail_nodes:
+            ui_node.update_detail_window()
 
     def remove_ui_node(self, ui_node_item: UINode):
         """
@@ -667,11 +943,13 @@ class MainWindow(QWidget):
                 self.remove_ui_link(link)
 
             self.scene.removeItem(ui_node_item)
+            self._open_detail_nodes.discard(ui_node_item)
             if ui_node_item.name in self.ui_nodes:
                 del self.ui_nodes[ui_node_item.name]
                 self._controller.remove_sim_node(ui_node_item.name) # Inform controller to remove sim node
-            self._align_ui_elements()
-            print(f"Removed UI node and requested removal of sim node: {ui_node_item.name}")
+            if not self._suspend_layout:
+                self._align_ui_elements()
+            log.debug("Removed UI node and requested removal of sim node: %s", ui_node_item.name)
     
     def add_ui_link(self, sim_link_obj: SimLink, peer1_name: str, peer2_name: str):
         """
@@ -683,30 +961,127 @@ class MainWindow(QWidget):
             peer1_name: The name of the first connected node.
             peer2_name: The name of the second connected node.
         """
+        pair = frozenset((peer1_name, peer2_name))
+        existing = self._link_by_pair.get(pair)
+        if existing is not None:
+            existing.set_sim_link_ref2(sim_link_obj)
+            return # one link per dual
         peer1_node = self.ui_nodes.get(peer1_name)
         peer2_node = self.ui_nodes.get(peer2_name)
         sim_link_name = f"{peer1_name}-{peer2_name}"
-        if f"{peer2_name}-{peer1_name}" in self.ui_links.keys():
-            old_ui_link = self.ui_links[f"{peer2_name}-{peer1_name}"]
-            old_ui_link.set_sim_link_ref2(sim_link_obj)
-            return # one link per dual
         if not peer1_node or not peer2_node:
             self._controller.log_message(f"Cannot add link '{sim_link_name}': one or both nodes '{peer1_name}', '{peer2_name}' do not exist in UI.")
             return
 
         new_ui_link = UILink(self, sim_link_name, peer1_node, peer2_node)
+        # link geometry changes every step; caching would just thrash
+        new_ui_link.setCacheMode(QGraphicsItem.NoCache)
         new_ui_link.set_sim_link_ref(sim_link_obj)
 
         self.ui_links[sim_link_name] = new_ui_link
+        self._link_by_pair[pair] = new_ui_link
         self.scene.addItem(new_ui_link)
-        self._align_ui_elements()
+        if not self._suspend_layout:
+            self._align_ui_elements()
+
+    def _rebuild_geometry_arrays(self):
+        """Rebuilds the SoA node-center and link-endpoint-index arrays."""
+        node_index = {name: i for i, name in enumerate(self.ui_nodes)}
+        self._node_xy = np.zeros((len(node_index), 2), dtype=np.float32)
+        for name, ui_node in self.ui_nodes.items():
+            center = ui_node.center_point()
+            self._node_xy[node_index[name]] = (center.x(), center.y())
+
+        new_link_list = [
+            link for link in self.ui_links.values()
+            if link.start_node.name in node_index and link.end_node.name in node_index
+        ]
+        if new_link_list != self._link_list:
+            # ordering changed; the previous endpoint rows no longer line up
+            self._prev_endpoints = None
+        self._link_list = new_link_list
+        self._link_node_idx = np.zeros((len(self._link_list), 2), dtype=np.int32)
+        for i, link in enumerate(self._link_list):
+            self._link_node_idx[i] = (node_index[link.start_node.name], node_index[link.end_node.name])
+        self._geometry_dirty = True
+        self.scene.setBspTreeDepth(max(1, int(math.log2(max(2, len(node_index))))))
+
+    def add_ui_nodes_bulk(self, sim_nodes: dict):
+        """Adds many UI nodes with indexing, repaints, and layout suspended."""
+        with self.batch_update():
+            saved_suspend = self._suspend_layout
+            self._suspend_layout = True
+            try:
+                for name, sim_node in sim_nodes.items():
+                    self.add_ui_node(name, sim_node)
+            finally:
+                self._suspend_layout = saved_suspend
+        if not self._suspend_layout:
+            self._align_ui_elements()
+
+    def add_ui_links_bulk(self, sim_links: list):
+        """Adds many UI links from (link, src, dst) tuples in one batch."""
+        with self.batch_update():
+            saved_suspend = self._suspend_layout
+            self._suspend_layout = True
+            try:
+                for sim_link, src, dst in sim_links:
+                    self.add_ui_link(sim_link, src, dst)
+            finally:
+                self._suspend_layout = saved_suspend
+        if not self._suspend_layout:
+            self._align_ui_elements()
+
+    def update_changed(self, node_names, link_pairs):
+        """Refreshes only the UI items named in a simulation step delta.
+
+        Args:
+            node_names: Iterable of sim node names whose state may have changed.
+            link_pairs: Iterable of (src, dst) pairs whose queues may have changed.
+        """
+        scale = self.view.transform().m11()
+        for name in node_names:
+            ui_node = self.ui_nodes.get(name)
+            if ui_node:
+                ui_node.set_lod(scale)
+                ui_node.update_ui_from_sim_state()
+        for src, dst in link_pairs:
+            ui_link = self._link_by_pair.get(frozenset((src, dst)))
+            if ui_link:
+                ui_link.update_info_text()
+        # open detail windows diff-skip internally, refresh them all
+        for ui_node in self._open_detail_nodes:
+            ui_node.update_detail_window()
 
     def update_ui_links(self):
-        """Updates the positions of all UI links based on their connected nodes."""
+        """Refreshes link geometry and info text; positions follow node moves automatically."""
+        if self._geometry_dirty and self._link_list:
+            # One vectorised gather of all endpoints plus one midpoint kernel
+            # call, then a plain loop that only pushes rows that moved.
+            endpoints = self._node_xy[self._link_node_idx.reshape(-1)].reshape(-1, 4)
+            if self._prev_endpoints is not None and self._prev_endpoints.shape == endpoints.shape:
+                changed = np.nonzero(np.any(endpoints != self._prev_endpoints, axis=1))[0].tolist()
+            else:
+                changed = range(len(self._link_list))
+            if changed:
+                mid_x = np.empty(len(self._link_list), dtype=np.float32)
+                mid_y = np.empty(len(self._link_list), dtype=np.float32)
+                link_midpoints(np.ascontiguousarray(endpoints[:, 0]), np.ascontiguousarray(endpoints[:, 1]),
+                               np.ascontiguousarray(endpoints[:, 2]), np.ascontiguousarray(endpoints[:, 3]),
+                               INFO_TEXT_OFFSET_X, INFO_TEXT_OFFSET_Y, mid_x, mid_y)
+                endpoint_rows = endpoints.tolist()
+                mid_x_list, mid_y_list = mid_x.tolist(), mid_y.tolist()
+                for i in changed:
+                    ui_link = self._link_list[i]
+                    x1, y1, x2, y2 = endpoint_rows[i]
+                    ui_link.setLine(x1, y1, x2, y2)
+                    ui_link.position_info_text_at(mid_x_list[i], mid_y_list[i])
+            self._prev_endpoints = endpoints
+            self._geometry_dirty = False
+        visible = self._visible_scene_rect()
         for ui_link in self.ui_links.values():
-            ui_link.update_position()
-            ui_link.update_info_text()
-        self.scene.update()
+            if ui_link.sceneBoundingRect().intersects(visible):
+                ui_link.update_info_text()
 
     def remove_ui_link(self, ui_link_item: UILink):
         """
@@ -716,16 +1091,18 @@ class MainWindow(QWidget):
             ui_link_item: The UILink object to remove.
         """
         if ui_link_item and ui_link_item.scene() == self.scene:
-            if ui_link_item.start_node and ui_link_item in ui_link_item.start_node.connected_lines:
-                ui_link_item.start_node.connected_lines.remove(ui_link_item)
-            if ui_link_item.end_node and ui_link_item in ui_link_item.end_node.connected_lines:
-                ui_link_item.end_node.connected_lines.remove(ui_link_item)
+            if ui_link_item.start_node:
+                ui_link_item.start_node.connected_lines.discard(ui_link_item)
+            if ui_link_item.end_node:
+                ui_link_item.end_node.connected_lines.discard(ui_link_item)
 
             self.scene.removeItem(ui_link_item)
-            if ui_link_item.name in self.ui_links:
-                del self.ui_links[ui_link_item.name]
-                self._controller.remove_sim_link(ui_link_item.name) # Inform controller to remove sim link
-            print(f"Removed UI link and requested removal of sim link: {ui_link_item.name}")
+            self._link_by_pair.pop(frozenset((ui_link_item.start_node.name, ui_link_item.end_node.name)), None)
+            # one hashed pop instead of a membership check plus delete
+            if self.ui_links.pop(ui_link_item.name, None) is not None:
+                # Inform controller to remove sim link
+                self._controller.remove_sim_link(ui_link_item.start_node.name, ui_link_item.end_node.name)
+            log.debug("Removed UI link and requested removal of sim link: %s", ui_link_item.name)
 
     def _on_add_sim_link_clicked(self):
         """Handles the 'Add Sim Link' button click."""
@@ -747,25 +1124,59 @@ class MainWindow(QWidget):
         """
         Aligns all UI nodes in a circular formation and updates the positions of all links.
         """
-        mid_x = SCENE_WIDTH / 2
-        mid_y = SCENE_HEIGHT / 2
-        
         nodes_list = list(self.ui_nodes.values())
         num_nodes = len(nodes_list)
 
         if not nodes_list:
             return
 
-        for i, node in enumerate(nodes_list):
-            angle = i * 2 * math.pi / num_nodes
-            x = ALIGNMENT_RADIUS * math.sin(angle) + mid_x
-            y = ALIGNMENT_RADIUS * math.cos(angle) + mid_y
-            node.setPos(x, y)
-        self.update_ui_links()
+        if num_nodes >= ASYNC_LAYOUT_THRESHOLD and num_nodes not in _LAYOUT_CACHE:
+            # compute the trig on a worker thread, then realign once the
+            # cache is warm rather than stalling the GUI on a huge layout
+            task = _LayoutTask(num_nodes)
+            task.signals.finished.connect(self._on_layout_ready)
+            QThreadPool.globalInstance().start(task)
+            return
+
+        xs, ys = _circle_layout(num_nodes)
+        # suspend indexing and repaints for the mass reposition; one rebuild
+        # afterwards beats N incremental BSP updates
+        saved_index_method = self.scene.itemIndexMethod()
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.view.setUpdatesEnabled(False)
+        try:
+            for node, x, y in zip(nodes_list, xs, ys):
+                node.setPos(x, y)
+        finally:
+            self.scene.setItemIndexMethod(saved_index_method)
+            self.view.setUpdatesEnabled(True)
+        self._rebuild_geometry_arrays()
+
+    def _on_layout_ready(self, num_nodes: int):
+        """Applies an asynchronously computed layout if the count still matches."""
+        if len(self.ui_nodes) == num_nodes:
+            self._align_ui_elements()
 
     def log_message(self, message: str):
-        """Appends a message to the output log display."""
-        self.output_log.append(message)
+        """Queues a message for the output log; messages flush in one batch."""
+        self._log_buffer.append(message)
+        if not self._log_pending:
+            self._log_pending = True
+            QTimer.singleShot(0, self._flush_log)
+
+    def _flush_log(self):
+        """Appends all pending messages to the log in a single document edit."""
+        if self._log_buffer:
+            cursor = self.output_log.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText("\n".join(self._log_buffer) + "\n")
+            self._log_buffer.clear()
+        self._log_pending = False
+
+    def append_stream_text(self, text: str):
+        """Appends captured stdout text to the log without re-laying-out the document."""
+        self.output_log.moveCursor(QTextCursor.End)
+        self.output_log.insertPlainText(text)
 
 class Controller(QObject):
     """
@@ -786,12 +1197,34 @@ class Controller(QObject):
         self.main_window = MainWindow(self)
         self.log_message_signal.connect(self.main_window.log_message)
 
+        # Capture simulation print() output into the GUI log, batched by
+        # the stream so each flush costs one append.
+        self._print_capture_stream = QtOutputStream()
+        # Queued delivery: the write side returns immediately and the log
+        # append runs from the event loop, so sim code never blocks on a
+        # QTextEdit reflow.
+        self._print_capture_stream.text_written.connect(
+            self.main_window.append_stream_text, Qt.QueuedConnection)
+        # Install the capture once for the whole session rather than
+        # swapping sys.stdout on every step; restore the real stream at exit.
+        self._original_stdout = sys.stdout
+        sys.stdout = self._print_capture_stream
+        atexit.register(self._restore_stdout)
+
+    def _restore_stdout(self):
+        sys.stdout = self._original_stdout
+
     def load_topology(self, file):
         """Loads topology from yaml files"""
         self.reset_simulation()
         self._topology = loadTopologyFile(file)
         self._simulation_generator = self._topology.step()
-        self._link_topology()
+        # populate everything, then lay out and repaint once
+        self.main_window.begin_bulk_load()
+        try:
+            self._link_topology()
+        finally:
+            self.main_window.end_bulk_load()
         self.log_message(f"Loaded yaml file: {file}")
     
     def dump_topology(self, file):
@@ -800,12 +1233,12 @@ class Controller(QObject):
 
     def _link_topology(self):
         """Generates GUI elements for each top element"""
-        for node_name, node in self._topology.nodes.items():
-            self.main_window.add_ui_node(node_name, node)
-        
-        for src, dstList in self._topology.links.items():
-            for dst, link in dstList.items():
-                self.main_window.add_ui_link(link, src, dst)
+        self.main_window.add_ui_nodes_bulk(self._topology.nodes)
+        self.main_window.add_ui_links_bulk([
+            (link, src, dst)
+            for src, dstList in self._topology.links.items()
+            for dst, link in dstList.items()
+        ])
 
     def reset_simulation(self):
         """Resets the entire simulation, clearing UI and re-initializing topology."""
@@ -842,7 +1275,9 @@ class Controller(QObject):
             name: The name of the node to remove.
         """
         if name in self._topology.nodes:
-            del self._topology.nodes[name]
+            # delNode tears down the node's incident links via the adjacency
+            # map, so no stale entries survive in the links table
+            self._topology.delNode(name)
             self.log_message(f"Removed simulation node '{name}'.")
         else:
             self.log_message(f"Simulation node '{name}' not found.")
@@ -856,34 +1291,37 @@ class Controller(QObject):
             peer1_name: The name of the first node to connect.
             peer2_name: The name of the second node to connect.
         """
-        name = f"{peer2_name}-{peer1_name}"
-        if name in self._topology.links:
-            self.log_message(f"Link '{name}' already exists in simulation.")
-            return
-        name = f"{peer1_name}-{peer2_name}"
-        if name in self._topology.links:
-            self.log_message(f"Link '{name}' already exists in simulation.")
+        # the topology already keys links by adjacency, so duplicate
+        # detection is a nested lookup rather than two joined-name probes;
+        # display strings are only built on the (cold) logging paths
+        links = self._topology.links
+        if peer2_name in links.get(peer1_name, ()):
+            self.log_message(f"Link between '{peer1_name}' and '{peer2_name}' already exists in simulation.")
             return
 
         try:
-            sim_link = self._topology.addLink(peer1_name, peer2_name)
-            self.main_window.add_ui_link(sim_link, peer1_name, peer2_name)
-            self.log_message(f"Added simulation link '{name}' between '{peer1_name}' and '{peer2_name}'.")
+            self._topology.addLink(peer1_name, peer2_name)
+            self.main_window.add_ui_link(links[peer1_name][peer2_name], peer1_name, peer2_name)
+            self.main_window.add_ui_link(links[peer2_name][peer1_name], peer2_name, peer1_name)
+            self.log_message(f"Added simulation link between '{peer1_name}' and '{peer2_name}'.")
         except Exception as e:
-            self.log_message(f"Failed to add link '{name}': {e}. Ensure nodes '{peer1_name}' and '{peer2_name}' exist.")
+            self.log_message(f"Failed to add link: {e}. Ensure nodes '{peer1_name}' and '{peer2_name}' exist.")
 
-    def remove_sim_link(self, name: str):
+    def remove_sim_link(self, peer1_name: str, peer2_name: str):
         """
-        Removes a simulation link from the topology.
+        Removes both directions of a simulation link from the topology.
 
         Args:
-            name: The name of the link to remove.
+            peer1_name: The name of the first connected node.
+            peer2_name: The name of the second connected node.
         """
-        if name in self._topology.links:
-            del self._topology.links[name]
-            self.log_message(f"Removed simulation link '{name}'.")
+        links = self._topology.links
+        forward = links.get(peer1_name, {}).pop(peer2_name, None)
+        backward = links.get(peer2_name, {}).pop(peer1_name, None)
+        if forward is not None or backward is not None:
+            self.log_message(f"Removed simulation link between '{peer1_name}' and '{peer2_name}'.")
         else:
-            self.log_message(f"Simulation link '{name}' not found.")
+            self.log_message(f"Simulation link between '{peer1_name}' and '{peer2_name}' not found.")
 
     def step_simulation(self):
         """
@@ -894,15 +1332,23 @@ class Controller(QObject):
             return
 
         try:
-            next(self._simulation_generator)
-            self.log_message("\n--- Simulation Step Executed ---")
-
+            delta = next(self._simulation_generator)
+            # same-thread hot path: batch the per-node lines and skip the
+            # signal dispatch entirely
+            lines = ["\n--- Simulation Step Executed ---"]
             for node_name, sim_node_obj in self._topology.nodes.items():
                 is_waiting = node_name in self._topology.waiting
-                self.log_message(f"Node: {sim_node_obj.name}, State: {sim_node_obj.state}, Is waiting: {is_waiting}")
-
-            self.main_window.update_ui_nodes()
-            self.main_window.update_ui_links()
+                lines.append(f"Node: {sim_node_obj.name}, State: {sim_node_obj.state}, Is waiting: {is_waiting}")
+            self._log_direct("\n".join(lines))
+
+            with self.main_window.batch_update():
+                if delta is None:
+                    # older generator contract: no delta, repaint everything
+                    self.main_window.update_ui_nodes()
+                    self.main_window.update_ui_links()
+                else:
+                    changed_nodes, changed_links = delta
+                    self.main_window.update_changed(changed_nodes, changed_links)
 
         except StopIteration:
             self.log_message("Simulation converged: Nothing left to do.")
@@ -921,16 +1367,16 @@ class Controller(QObject):
 
         self.log_message("\n--- Continuing ---")
         try:
-            for _ in self._simulation_generator:
-                # For now only logs, need to add an update here
-                pass
+            # drain the generator entirely in C, no per-step interpreter loop
+            collections.deque(self._simulation_generator, maxlen=0)
             self.log_message("Simulation converged successfully.")
         except Exception as e:
             self.log_message(f"Error during continuous simulation: {e}")
         finally:
             self._simulation_generator = None # Mark as converged or errored
-            self.main_window.update_ui_nodes()
-            self.main_window.update_ui_links()
+            with self.main_window.batch_update():
+                self.main_window.update_ui_nodes()
+                self.main_window.update_ui_links()
 
 
     def log_message(self, message: str):
@@ -942,8 +1388,20 @@ class Controller(QObject):
         """
         self.log_message_signal.emit(message)
 
+    def _log_direct(self, message: str):
+        """
+        Logs a message without signal marshalling; only safe on the GUI thread.
+
+        Args:
+            message: The string message to log.
+        """
+        self.main_window.log_message(message)
+
 
 if __name__ == "__main__":
+    # debug traces stay unformatted and unallocated unless enabled
+    logging.basicConfig(level=logging.WARNING)
+
     app = QApplication(sys.argv)
 
     # AI styling